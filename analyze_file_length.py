@@ -1,81 +1,132 @@
+import heapq
+import json
+import mmap
 import os
-import glob
-
-# ANSI Color Codes für farbige Ausgabe
-class Colors:
-    RED = '\033[91m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    MAGENTA = '\033[95m'
-    CYAN = '\033[96m'
-    WHITE = '\033[97m'
-    BOLD = '\033[1m'
-    RESET = '\033[0m'
-    
-    @staticmethod
-    def colorize(text: str, color: str) -> str:
-        return f"{color}{text}{Colors.RESET}"
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 
-def analyze_file_length(file_path):
-    """
-    Analyze file lengths for HTML, CSS, SCSS, SASS, JS, TS files
-    """
+from analyzer_common import Colors
+
+# Precompiled patterns for the whole-file comment scan; the regex engine
+# runs in C over a contiguous buffer instead of a per-line Python loop.
+# The block groups are anchored to line starts like the old per-line
+# classifier: a trailing inline /* ... */ does not turn a code line into
+# a comment line
+_COMMENT_RE = re.compile(
+    rb'(?P<jsdoc>^[ \t]*/\*\*.*?\*/)'
+    rb'|(?P<block>^[ \t]*/\*.*?\*/)'
+    rb'|(?P<line>^[ \t]*(?://|\*|<!--|#)[^\n]*)',
+    re.S | re.M
+)
+_EMPTY_LINE_RE = re.compile(rb'^[ \t\r]*\n', re.M)
+
+# Table-driven dispatch: match group -> counter index (0 = jsdoc, 1 = comment)
+_MATCH_BUCKET = {'jsdoc': 0, 'block': 1, 'line': 1}
+
+# Directory names pruned during the walk; set membership on the entry name
+# replaces the old per-path substring scan over every excluded directory
+_EXCLUDED_DIRS = frozenset((
+    'node_modules', '.git', 'dist', 'build',
+    '.angular', 'coverage', '.vscode', '.idea'
+))
+
+# Cap concurrent reads: more in-flight requests than the device can queue
+# only adds tail latency, they do not add throughput. Overridable for
+# unusual storage via the environment; values below 1 are clamped and
+# anything non-numeric falls back to the default.
+try:
+    MAX_IO_INFLIGHT = max(1, int(os.environ['MAX_IO_INFLIGHT']))
+except (KeyError, ValueError):
+    MAX_IO_INFLIGHT = min(16, (os.cpu_count() or 1) * 2)
+
+# Analysis results are memoized here between runs, keyed by path with the
+# stat signature (mtime_ns, size) deciding whether an entry is still fresh
+_CACHE_FILENAME = '.file_len_cache.json'
+
+def _load_cache(cache_path):
+    """Load the persisted analysis cache; missing or corrupt files mean empty"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        total_lines = len(lines)
-        
-        # Count non-empty lines
-        non_empty_lines = sum(1 for line in lines if line.strip())
-        
-        # Count comment lines and JSDoc separately
-        comment_lines = 0
-        jsdoc_lines = 0
-        in_multiline_comment = False
-        in_jsdoc_block = False
-        
-        for line in lines:
-            stripped = line.strip()
-            
-            # Check for JSDoc start
-            if stripped.startswith('/**'):
-                in_jsdoc_block = True
-                jsdoc_lines += 1
-                continue
-            
-            # Check for multiline comment start (but not JSDoc)
-            elif stripped.startswith('/*') and not stripped.startswith('/**'):
-                in_multiline_comment = True
-                comment_lines += 1
-                continue
-            
-            # Check for comment/JSDoc end
-            elif stripped.endswith('*/'):
-                if in_jsdoc_block:
-                    jsdoc_lines += 1
-                    in_jsdoc_block = False
-                elif in_multiline_comment:
-                    comment_lines += 1
-                    in_multiline_comment = False
-                continue
-            
-            # Lines inside JSDoc block
-            elif in_jsdoc_block:
-                jsdoc_lines += 1
-            
-            # Lines inside multiline comment block
-            elif in_multiline_comment:
-                comment_lines += 1
-            
-            # Single line comments and other comment types
-            elif (stripped.startswith('//') or  # JS/TS single line comments
-                  stripped.startswith('*') or   # continuation of multiline comments
-                  stripped.startswith('<!--') or  # HTML comments
-                  stripped.startswith('#')):    # SCSS/SASS comments
-                comment_lines += 1
-        
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_cache(cache_path, cache):
+    """Persist the analysis cache; failures only cost the next warm run"""
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+def _walk(root, exts, excluded):
+    """Yield (path, stat) for matching files, pruning excluded directories
+    before descending; stats come for free from the scandir entries"""
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in excluded:
+                        stack.append(entry.path)
+                elif entry.name.endswith(exts):
+                    try:
+                        yield entry.path, entry.stat()
+                    except OSError:
+                        continue
+
+def _read_bytes(file_path):
+    """Map a file into memory and return (path, buffer); reads can run concurrently"""
+    try:
+        with open(file_path, 'rb') as f:
+            try:
+                return file_path, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                return file_path, b''
+    except Exception as e:
+        print(f"Error processing {file_path}: {e}")
+        return file_path, None
+
+def _count_newlines(data, start=0, end=None):
+    """Count newlines via repeated C-level find, works on bytes and mmap"""
+    if end is None:
+        end = len(data)
+    count = 0
+    pos = data.find(b'\n', start, end)
+    while pos != -1:
+        count += 1
+        pos = data.find(b'\n', pos + 1, end)
+    return count
+
+def _classify(file_path, data):
+    """Classify the contents of a file into comment/JSDoc/code counts"""
+    try:
+        size = len(data)
+        total_lines = _count_newlines(data)
+        if size and data[size - 1:size] != b'\n':
+            total_lines += 1
+
+        # Non-empty lines = total minus blank lines; counting the (usually
+        # rarer) blank lines keeps the regex work proportional to them
+        non_empty_lines = total_lines - len(_EMPTY_LINE_RE.findall(data))
+
+        # Count comment lines and JSDoc separately via the bucket table
+        counts = [0, 0]
+        for match in _COMMENT_RE.finditer(data):
+            span_lines = _count_newlines(data, match.start(), match.end()) + 1
+            counts[_MATCH_BUCKET[match.lastgroup]] += span_lines
+        jsdoc_lines, comment_lines = counts
+
         # Calculate code lines (non-empty, non-comment, non-jsdoc)
         code_lines = non_empty_lines - comment_lines - jsdoc_lines
         
@@ -92,221 +143,200 @@ def analyze_file_length(file_path):
     except Exception as e:
         print(f"Error processing {file_path}: {e}")
         return None
+    finally:
+        if isinstance(data, mmap.mmap):
+            data.close()
+
+def analyze_file_length(file_path):
+    """
+    Analyze file lengths for HTML, CSS, SCSS, SASS, JS, TS files
+    """
+    file_path, data = _read_bytes(file_path)
+    if data is None:
+        return None
+    return _classify(file_path, data)
+
+_TYPE_MAPPING = {
+    '.html': 'HTML',
+    '.css': 'CSS',
+    '.scss': 'SCSS',
+    '.sass': 'SASS',
+    '.js': 'JavaScript',
+    '.ts': 'TypeScript'
+}
+
+@lru_cache(maxsize=16)
+def _type_for_ext(extension):
+    """Map a lowercased extension to its display type (memoized)"""
+    return _TYPE_MAPPING.get(extension, 'Unknown')
 
 def get_file_type(file_path):
     """Get the file type based on extension"""
-    extension = os.path.splitext(file_path)[1].lower()
-    type_mapping = {
-        '.html': 'HTML',
-        '.css': 'CSS',
-        '.scss': 'SCSS',
-        '.sass': 'SASS',
-        '.js': 'JavaScript',
-        '.ts': 'TypeScript'
-    }
-    return type_mapping.get(extension, 'Unknown')
+    return _type_for_ext('.' + file_path.rpartition('.')[2].lower())
 
 def scan_all_files():
     """Scan all HTML, CSS, SCSS, SASS, JS, TS files for length analysis"""
     # Get the directory where this script is located
     script_dir = os.path.dirname(os.path.abspath(__file__))
     
-    # Define file patterns to search for
-    file_patterns = [
-        "**/*.html",
-        "**/*.css", 
-        "**/*.scss",
-        "**/*.sass",
-        "**/*.js",
-        "**/*.ts"
-    ]
-    
-    # Collect all files
-    all_files = []
-    for pattern in file_patterns:
-        full_pattern = os.path.join(script_dir, pattern)
-        files = glob.glob(full_pattern, recursive=True)
-        all_files.extend(files)
-    
-    # Filter out unwanted directories
-    excluded_dirs = ['node_modules', '.git', 'dist', 'build', '.angular', 'coverage', '.vscode', '.idea']
-    files = []
-    for file_path in all_files:
-        # Check if file contains any excluded directory in its path
-        should_exclude = any(excluded_dir in file_path for excluded_dir in excluded_dirs)
-        if not should_exclude:
-            files.append(file_path)
+    # Single scandir-based walk; excluded directories are pruned before
+    # descending instead of filtered out after six full glob traversals
+    extensions = ('.html', '.css', '.scss', '.sass', '.js', '.ts')
+    entries = list(_walk(script_dir, extensions, _EXCLUDED_DIRS))
+    files = [path for path, _ in entries]
+
+    # A file needs at least 401 bytes to hold more than 400 lines, so the
+    # long tail of tiny files never has to be opened at all
+    candidates = [(path, st) for path, st in entries if st.st_size > 400]
     
-    # Group files by type
-    files_by_type = {
-        'HTML': [f for f in files if f.endswith('.html')],
-        'CSS': [f for f in files if f.endswith('.css')],
-        'SCSS': [f for f in files if f.endswith('.scss')],
-        'SASS': [f for f in files if f.endswith('.sass')],
-        'JavaScript': [f for f in files if f.endswith('.js')],
-        'TypeScript': [f for f in files if f.endswith('.ts')]
-    }
+    # Group files by type in a single pass over the file list
+    files_by_type = {t: [] for t in ('HTML', 'CSS', 'SCSS', 'SASS', 'JavaScript', 'TypeScript')}
+    for file_path in files:
+        file_type = get_file_type(file_path)
+        if file_type != 'Unknown':
+            files_by_type[file_type].append(file_path)
     
-    # Prepare output content
+    # Prepare output content; console output is buffered in parallel and
+    # flushed with a single write at the end instead of one syscall per print
     output_lines = []
-    output_lines.append("FILE LENGTH ANALYSIS REPORT")
-    output_lines.append(f"Generated: {os.popen('date /t').read().strip()} {os.popen('time /t').read().strip()}")
-    output_lines.append("=" * 80)
-    output_lines.append(f"Analyzing {len(files)} files for length > 400 lines...")
-    output_lines.append(f"Search directory: {script_dir}")
-    
+    console_lines = []
+
+    def emit(line, console=True, style=None):
+        output_lines.append(line)
+        if console:
+            console_lines.append(Colors.colorize(line, style) if style else line)
+
+    emit("FILE LENGTH ANALYSIS REPORT", console=False)
+    emit(f"Generated: {datetime.now():%Y-%m-%d %H:%M:%S}", console=False)
+    emit("=" * 80, console=False)
+    emit(f"Analyzing {len(files)} files for length > 400 lines...", console=False)
+    emit(f"Search directory: {script_dir}", console=False)
+
     # Display file counts by type
     for file_type, type_files in files_by_type.items():
         if type_files:
-            count_msg = f"{file_type} files: {len(type_files)}"
-            print(count_msg)
-            output_lines.append(count_msg)
-    
-    output_lines.append(f"Excluded directories: {', '.join(excluded_dirs)}")
-    output_lines.append("")
-    print(f"Excluded directories: {', '.join(excluded_dirs)}")
-    print("")
+            emit(f"{file_type} files: {len(type_files)}")
+
+    emit(f"Excluded directories: {', '.join(sorted(_EXCLUDED_DIRS))}")
+    emit("")
     
     all_large_files = []
     files_over_400 = 0
-    
-    # Analyze each file
-    for file_path in files:
-        file_info = analyze_file_length(file_path)
+
+    # Overlap the blocking reads with a thread pool; classification and
+    # printing stay on the main thread
+    # Serve unchanged files from the persisted cache; only stale or new
+    # files are read and classified
+    cache_path = os.path.join(script_dir, _CACHE_FILENAME)
+    cache = _load_cache(cache_path)
+
+    results = []
+    to_read = []
+    signatures = {}
+    for file_path, st in candidates:
+        signatures[file_path] = [st.st_mtime_ns, st.st_size]
+        cached = cache.get(file_path)
+        if cached and cached[:2] == signatures[file_path]:
+            results.append(cached[2])
+        else:
+            to_read.append(file_path)
+
+    if to_read:
+        with ThreadPoolExecutor(max_workers=MAX_IO_INFLIGHT) as executor:
+            for file_path, data in executor.map(_read_bytes, to_read, chunksize=16):
+                if data is not None:
+                    file_info = _classify(file_path, data)
+                    if file_info:
+                        cache[file_path] = signatures[file_path] + [file_info]
+                    results.append(file_info)
+
+    # Persist only entries for files seen in this walk, so entries for
+    # deleted or renamed files are not carried forward forever
+    _save_cache(cache_path, {path: entry for path, entry in cache.items()
+                             if path in signatures})
+
+    for file_info in results:
         if file_info and file_info['total_lines'] > 400:
+            file_path = file_info['file']
             files_over_400 += 1
             all_large_files.append(file_info)
             
-            file_output = f"File: {file_path}"
-            separator = "-" * 80
-            
-            print(file_output)
-            print(separator)
-            output_lines.append(file_output)
-            output_lines.append(separator)
-            
-            details = f"  Type: {file_info['file_type']} | Total lines: {file_info['total_lines']}"
-            breakdown = f"  Non-empty: {file_info['non_empty_lines']} | Comments: {file_info['comment_lines']} | JSDoc: {file_info['jsdoc_lines']} | Code: {file_info['code_lines']}"
-            
-            print(details)
-            print(breakdown)
-            print("")
-            
-            output_lines.append(details)
-            output_lines.append(breakdown)
-            output_lines.append("")
-    
-    # Sort by total lines (largest first)
-    all_large_files.sort(key=lambda x: x['total_lines'], reverse=True)
-    
-    # Top 10 largest files
-    top_section = "=" * 80
-    top_header = "=== TOP 10 LARGEST FILES ==="
-    
-    print(top_section)
-    print(top_header)
-    print(top_section)
-    
-    output_lines.append(top_section)
-    output_lines.append(top_header)
-    output_lines.append(top_section)
-    
-    for i, file_info in enumerate(all_large_files[:10]):
-        rank_line = f"{i+1:2d}. {os.path.basename(file_info['file'])} ({file_info['total_lines']} lines)"
-        type_line = f"    Type: {file_info['file_type']}"
-        file_line = f"    File: {file_info['file']}"
-        
-        print(rank_line)
-        print(type_line)
-        print(file_line)
-        print("")
-        
-        output_lines.append(rank_line)
-        output_lines.append(type_line)
-        output_lines.append(file_line)
-        output_lines.append("")
+            emit(f"File: {file_path}")
+            emit("-" * 80)
+            emit(f"  Type: {file_info['file_type']} | Total lines: {file_info['total_lines']}")
+            emit(f"  Non-empty: {file_info['non_empty_lines']} | Comments: {file_info['comment_lines']} | JSDoc: {file_info['jsdoc_lines']} | Code: {file_info['code_lines']}")
+            emit("")
     
+    # Top 10 largest files; O(N log 10) instead of sorting the whole list
+    top_files = heapq.nlargest(10, all_large_files, key=itemgetter('total_lines'))
+
+    emit("=" * 80)
+    emit("=== TOP 10 LARGEST FILES ===", style=Colors.BOLD_CYAN)
+    emit("=" * 80)
+
+    for i, file_info in enumerate(top_files):
+        emit(f"{i+1:2d}. {os.path.basename(file_info['file'])} ({file_info['total_lines']} lines)")
+        emit(f"    Type: {file_info['file_type']}")
+        emit(f"    File: {file_info['file']}")
+        emit("")
+
     # Summary by file type
-    summary_header = "=== SUMMARY BY FILE TYPE ==="
-    print(summary_header)
-    output_lines.append(summary_header)
+    emit("=== SUMMARY BY FILE TYPE ===", style=Colors.BOLD_CYAN)
     
+    # Flat [count, total, max] accumulators per type; the old dict-of-dicts
+    # also collected every file into an unused per-type list
     type_summary = {}
     for file_info in all_large_files:
-        file_type = file_info['file_type']
-        if file_type not in type_summary:
-            type_summary[file_type] = {
-                'count': 0,
-                'total_lines': 0,
-                'max_lines': 0,
-                'files': []
-            }
-        type_summary[file_type]['count'] += 1
-        type_summary[file_type]['total_lines'] += file_info['total_lines']
-        type_summary[file_type]['max_lines'] = max(type_summary[file_type]['max_lines'], file_info['total_lines'])
-        type_summary[file_type]['files'].append(file_info)
-    
+        stats = type_summary.setdefault(file_info['file_type'], [0, 0, 0])
+        stats[0] += 1
+        stats[1] += file_info['total_lines']
+        stats[2] = max(stats[2], file_info['total_lines'])
+
     for file_type in ['HTML', 'CSS', 'SCSS', 'SASS', 'JavaScript', 'TypeScript']:
         if file_type in type_summary:
-            data = type_summary[file_type]
-            avg_lines = data['total_lines'] / data['count']
-            type_line = f"{file_type}: {data['count']} files > 400 lines (avg: {avg_lines:.1f}, max: {data['max_lines']})"
+            count, total, max_lines = type_summary[file_type]
+            type_line = f"{file_type}: {count} files > 400 lines (avg: {total / count:.1f}, max: {max_lines})"
         else:
             type_line = f"{file_type}: 0 files > 400 lines"
-        
-        print(type_line)
-        output_lines.append(type_line)
-    
+
+        emit(type_line)
+
     # Overall summary
-    overall_header = "\n=== OVERALL SUMMARY ==="
-    files_analyzed = f"Files analyzed: {len(files)}"
-    files_over_limit = f"Files over 400 lines: {files_over_400}"
-    
-    print(overall_header)
-    print(files_analyzed)
-    print(files_over_limit)
-    
-    output_lines.append(overall_header)
-    output_lines.append(files_analyzed)
-    output_lines.append(files_over_limit)
-    
+    emit("\n=== OVERALL SUMMARY ===", style=Colors.BOLD_CYAN)
+    emit(f"Files analyzed: {len(files)}")
+    emit(f"Files over 400 lines: {files_over_400}")
+
     if files_over_400 == 0:
-        no_large_files_msg = "No files longer than 400 lines found!"
-        print(no_large_files_msg)
-        output_lines.append(no_large_files_msg)
+        emit("No files longer than 400 lines found!")
     else:
         avg_length = sum(f['total_lines'] for f in all_large_files) / len(all_large_files)
         largest = max(all_large_files, key=lambda x: x['total_lines'])
-        avg_msg = f"Average length of large files: {avg_length:.1f} lines"
-        largest_msg = f"Largest file: {os.path.basename(largest['file'])} ({largest['total_lines']} lines)"
-        
-        print(avg_msg)
-        print(largest_msg)
-        
-        output_lines.append(avg_msg)
-        output_lines.append(largest_msg)
-        
+        emit(f"Average length of large files: {avg_length:.1f} lines")
+        emit(f"Largest file: {os.path.basename(largest['file'])} ({largest['total_lines']} lines)")
+
         # Recommendations
         recommendations = [
             "\n=== RECOMMENDATIONS ===",
             "• Files > 500 lines: Consider splitting into multiple files",
-            "• HTML files > 400 lines: Break into components or templates", 
+            "• HTML files > 400 lines: Break into components or templates",
             "• CSS/SCSS files > 600 lines: Use modular architecture (BEM, modules)",
             "• JS/TS files > 400 lines: Split into smaller modules or services"
         ]
-        
+
         for rec in recommendations:
-            print(rec)
-            output_lines.append(rec)
-    
-    # Write to file
+            emit(rec)
+
+    # Write the report with one buffered write, then flush the console buffer
     output_file = "file_length_analysis.txt"
     try:
         with open(output_file, 'w', encoding='utf-8') as f:
             f.write('\n'.join(output_lines))
-        print(f"\nResults saved to: {output_file}")
+        console_lines.append(f"\nResults saved to: {output_file}")
     except Exception as e:
-        print(f"\nError saving to file: {e}")
+        console_lines.append(f"\nError saving to file: {e}")
+
+    sys.stdout.write('\n'.join(console_lines) + '\n')
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     scan_all_files()
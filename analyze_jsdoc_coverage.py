@@ -1,465 +1,307 @@
 import os
-import re
-import glob
+import sys
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from analyzer_common import pool_context, tee
+from _ts_parse import (CANDIDATE_RE, MethodInfo, build_brace_match,
+                       determine_method_type, extract_method_name,
+                       find_method_end, is_documentable_declaration,
+                       line_offsets)
+
+# Directory names excluded from scanning, pruned before descending
+_EXCLUDED_DIRS = frozenset((
+    'node_modules', '.git', 'dist', 'build',
+    '.angular', 'coverage', '.vscode', '.idea'
+))
+
+def _walk(root):
+    """Yield .ts/.js paths below root, pruning excluded directories before
+    descending instead of globbing everything and filtering afterwards"""
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _EXCLUDED_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith(('.ts', '.js')):
+                    yield entry.path
 
 def analyze_jsdoc_coverage(file_path):
     """
     Analyze JSDoc coverage for methods and functions in TypeScript and JavaScript files
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        lines = content.split('\n')
+        with open(file_path, 'rb') as f:
+            data = f.read()
+
+        # Type-only and constant files contain no method bodies at all;
+        # two byte scans rule them out before any splitting or line work
+        if b'(' not in data or b'{' not in data:
+            return []
+
+        # Splitting on b'\n' keeps line indexes aligned with byte offsets
+        # in the raw buffer; stray \r is removed by the strip() calls
+        lines = data.split(b'\n')
         missing_jsdoc = []
-        
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            stripped = line.strip()
-            
-            # Skip empty lines, comments, and non-method lines
-            if (not stripped or 
-                stripped.startswith('//') or 
-                stripped.startswith('*') or 
-                stripped.startswith('/*') or
-                stripped.startswith('export ') or
-                stripped.startswith('import ') or
-                stripped.startswith('@') or
-                'interface' in stripped or
-                'enum' in stripped or
-                'type ' in stripped or
-                (stripped.startswith('class ') and '{' in stripped)):
-                i += 1
+
+        # Per-line brace opens and balance, computed once per file so the
+        # per-method boundary walks touch integers instead of re-scanning
+        # strings; the opens keep one-line bodies (delta 0) visible and
+        # the match index turns each method-end search into a lookup
+        brace_opens = [l.count(b'{') for l in lines]
+        brace_delta = [o - l.count(b'}') for o, l in zip(brace_opens, lines)]
+        brace_match = build_brace_match(brace_delta)
+
+        # One forward pass answers "is there a JSDoc directly above line i"
+        # for the whole file, instead of a backward walk per method
+        jsdoc_above = _build_jsdoc_above(lines)
+
+        line_starts = line_offsets(data)
+
+        # The candidate regex walks the raw buffer in C; Python only sees
+        # the identifier-plus-paren lines it reports
+        next_line = 0
+        for match in CANDIDATE_RE.finditer(data):
+            i = bisect_right(line_starts, match.start()) - 1
+            if i < next_line:
+                # Inside a method that was already consumed
+                continue
+            stripped = lines[i].strip()
+
+            # Skip comments and non-method lines among the candidates
+            if (stripped.startswith(b'export ') or
+                stripped.startswith(b'import ') or
+                b'interface' in stripped or
+                b'enum' in stripped or
+                b'type ' in stripped or
+                (stripped.startswith(b'class ') and b'{' in stripped)):
                 continue
-            
+
             # Check for method/function declarations
-            if is_method_declaration(stripped, lines, i):
-                method_info = analyze_method_jsdoc(lines, i, file_path)
-                if method_info and not method_info['has_jsdoc']:
+            if is_documentable_declaration(stripped, lines, i):
+                method_info = analyze_method_jsdoc(lines, i, file_path, brace_delta,
+                                                   brace_opens, jsdoc_above, brace_match)
+                if method_info and not method_info.has_jsdoc:
                     missing_jsdoc.append(method_info)
-                i = method_info['end_line'] if method_info else i + 1
-            else:
-                i += 1
-        
+                next_line = method_info.end_line if method_info else i + 1
+
         return missing_jsdoc
         
     except Exception as e:
         print(f"Error processing {file_path}: {e}")
         return []
 
-def is_method_declaration(stripped, lines, i):
-    """Check if this line is a method/function declaration"""
-    # Skip test methods (describe, it, beforeEach, etc.)
-    if (stripped.startswith('describe(') or 
-        stripped.startswith('it(') or 
-        stripped.startswith('beforeEach(') or 
-        stripped.startswith('afterEach(') or
-        stripped.startswith('beforeAll(') or
-        stripped.startswith('afterAll(')):
-        return False
-    
-    # Skip arrow functions - they typically don't need JSDoc
-    if '=>' in stripped:
-        return False
-    
-    # Skip variable declarations with method calls (const x = method(), let y = new Date(), etc.)
-    if (stripped.startswith('const ') or 
-        stripped.startswith('let ') or 
-        stripped.startswith('var ')) and '=' in stripped:
-        return False
-    
-    # Skip method calls that are part of variable assignments or return statements
-    if (stripped.startswith('return ') or 
-        stripped.startswith('const ') or 
-        stripped.startswith('let ') or 
-        stripped.startswith('var ') or
-        '= ' in stripped or
-        stripped.startswith('this.') or
-        'Math.' in stripped or
-        'console.' in stripped or
-        'document.' in stripped or
-        'window.' in stripped or
-        'localStorage.' in stripped or
-        'sessionStorage.' in stripped):
-        return False
-    
-    # Skip simple method calls (lines that only contain method invocations)
-    if ('(' in stripped and ')' in stripped and 
-        not stripped.endswith('{') and 
-        not stripped.endswith(':') and
-        not (i + 1 < len(lines) and lines[i + 1].strip() == '{')):
-        # This looks like a method call, not a declaration
-        return False
-    
-    # Constructor
-    if stripped.startswith('constructor'):
-        return True
-    
-    # Regular method/function with parentheses and either : or {
-    if ('(' in stripped and ')' in stripped and 
-        ((':' in stripped and ('{' in stripped or 
-         (i + 1 < len(lines) and lines[i + 1].strip() == '{'))) or
-         stripped.startswith('async ') or
-         stripped.startswith('function '))):
-        return True
-    
-    # Angular lifecycle hooks
-    if (stripped.startswith('ngOnInit') or 
-        stripped.startswith('ngOnDestroy') or 
-        stripped.startswith('ngOnChanges') or
-        stripped.startswith('ngAfterViewInit') or
-        stripped.startswith('ngAfterContentInit') or
-        stripped.startswith('ngAfterViewChecked') or
-        stripped.startswith('ngAfterContentChecked')):
-        return True
-    
-    return False
-
-def analyze_method_jsdoc(lines, start_line, file_path):
+def analyze_method_jsdoc(lines, start_line, file_path, brace_delta, brace_opens,
+                         jsdoc_above, brace_match):
     """Analyze a method for JSDoc documentation"""
     try:
         method_line = lines[start_line].strip()
-        
+
         # Extract method name
-        method_name = extract_method_name(method_line)
-        if not method_name:
-            return None
-        
+        method_name = extract_method_name(method_line) or 'unknown_method'
+
         # Check for JSDoc comment above the method
-        has_jsdoc = check_for_jsdoc(lines, start_line)
-        
-        # Find method boundaries
-        brace_count = 0
-        method_started = False
-        end_line = start_line
-        
-        i = start_line
-        while i < len(lines):
-            line = lines[i]
-            
-            # Count braces to find method boundaries
-            open_braces = line.count('{')
-            close_braces = line.count('}')
-            
-            if open_braces > 0:
-                method_started = True
-            
-            brace_count += open_braces - close_braces
-            
-            # Method ends when brace count returns to 0 or we hit a semicolon for arrow functions
-            if method_started and brace_count <= 0:
-                end_line = i
-                break
-            elif '=>' in method_line and ';' in line:
-                end_line = i
-                break
-            
-            i += 1
-        
-        return {
-            'file': file_path,
-            'method_name': method_name,
-            'start_line': start_line + 1,  # 1-based line numbers
-            'end_line': end_line + 1,
-            'declaration': method_line,
-            'has_jsdoc': has_jsdoc,
-            'method_type': determine_method_type(method_line)
-        }
-        
+        has_jsdoc = jsdoc_above[start_line]
+
+        # Find method boundaries by walking the precomputed brace deltas;
+        # arrow functions may end at a semicolon before any brace closes,
+        # so only they still need the per-line scan
+        if b'=>' in method_line:
+            brace_count = 0
+            method_started = False
+            end_line = start_line
+            i = start_line
+            while i < len(lines):
+                if brace_opens[i]:
+                    method_started = True
+                brace_count += brace_delta[i]
+                if method_started and brace_count <= 0:
+                    end_line = i
+                    break
+                elif b';' in lines[i]:
+                    end_line = i
+                    break
+                i += 1
+        else:
+            end, _ = find_method_end(brace_delta, brace_opens, start_line, brace_match)
+            end_line = start_line if end is None else end
+
+        return MethodInfo(
+            file=file_path,
+            method_name=method_name,
+            start_line=start_line + 1,  # 1-based line numbers
+            end_line=end_line + 1,
+            declaration=method_line.decode('utf-8', 'replace'),
+            has_jsdoc=has_jsdoc,
+            method_type=determine_method_type(method_line)
+        )
+
     except Exception as e:
         return None
 
-def check_for_jsdoc(lines, method_line_index):
-    """Check if there's a JSDoc comment above the method"""
-    # Look backwards from the method line to find JSDoc
-    i = method_line_index - 1
-    
-    # Skip empty lines and decorators
-    while i >= 0:
-        line = lines[i].strip()
-        
-        # Empty line - continue looking
-        if not line:
-            i -= 1
+def _build_jsdoc_above(lines):
+    """One forward pass marking, for every line, whether a JSDoc block ends
+    directly above it; blank lines, decorators and bare access modifiers in
+    between are allowed, anything else resets the flag"""
+    flags = [False] * len(lines)
+    pending = False      # a JSDoc closed and only skippable lines followed
+    in_comment = False   # inside a /* ... */ block
+    is_doc = False       # the open block started with /**
+    for i, raw in enumerate(lines):
+        line = raw.strip()
+        flags[i] = pending
+        if in_comment:
+            if line.endswith(b'*/'):
+                in_comment = False
+                pending = is_doc
             continue
-        
-        # Decorator - continue looking
-        if line.startswith('@'):
-            i -= 1
+        if line.startswith(b'/*'):
+            is_doc = line.startswith(b'/**')
+            if line.endswith(b'*/') and len(line) > 3:
+                pending = is_doc
+            else:
+                in_comment = True
+                pending = False
             continue
-        
-        # Access modifier line - continue looking
-        if line in ['public', 'private', 'protected', 'static', 'readonly']:
-            i -= 1
+        if (not line or line.startswith(b'@') or
+                line in (b'public', b'private', b'protected', b'static', b'readonly')):
             continue
-        
-        # Found JSDoc end marker
-        if line.endswith('*/'):
-            # Look backwards to find JSDoc start
-            j = i
-            while j >= 0:
-                jsdoc_line = lines[j].strip()
-                if jsdoc_line.startswith('/**'):
-                    return True
-                if not (jsdoc_line.startswith('*') or jsdoc_line.startswith('/*') or not jsdoc_line):
-                    break
-                j -= 1
-            break
-        
-        # Found single line JSDoc
-        if line.startswith('/**') and line.endswith('*/'):
-            return True
-        
-        # Found regular comment or other code - stop looking
-        if line.startswith('//') or not line.startswith('*'):
-            break
-        
-        i -= 1
-    
-    return False
-
-def extract_method_name(method_line):
-    """Extract method name from declaration line"""
-    # Constructor
-    if method_line.startswith('constructor'):
-        return 'constructor'
-    
-    # Angular lifecycle hooks
-    for hook in ['ngOnInit', 'ngOnDestroy', 'ngOnChanges', 'ngAfterViewInit', 
-                'ngAfterContentInit', 'ngAfterViewChecked', 'ngAfterContentChecked']:
-        if method_line.startswith(hook):
-            return hook
-    
-    # Regular methods/functions
-    patterns = [
-        r'function\s+(\w+)\s*\(',  # function methodName(
-        r'(\w+)\s*\(',  # methodName(
-        r'async\s+(\w+)\s*\(',  # async methodName(
-        r'private\s+(\w+)\s*\(',  # private methodName(
-        r'public\s+(\w+)\s*\(',  # public methodName(
-        r'protected\s+(\w+)\s*\(',  # protected methodName(
-        r'static\s+(\w+)\s*\(',  # static methodName(
-        r'get\s+(\w+)\s*\(',  # get methodName(
-        r'set\s+(\w+)\s*\(',  # set methodName(
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, method_line)
-        if match:
-            return match.group(1)
-    
-    return 'unknown_method'
-
-def determine_method_type(method_line):
-    """Determine the type of method for categorization"""
-    if method_line.startswith('constructor'):
-        return 'Constructor'
-    elif any(hook in method_line for hook in ['ngOnInit', 'ngOnDestroy', 'ngOnChanges', 'ngAfterView']):
-        return 'Lifecycle Hook'
-    elif method_line.startswith('private'):
-        return 'Private Method'
-    elif method_line.startswith('public'):
-        return 'Public Method'
-    elif method_line.startswith('protected'):
-        return 'Protected Method'
-    elif method_line.startswith('static'):
-        return 'Static Method'
-    elif method_line.startswith('function'):
-        return 'Function'
-    elif method_line.startswith('async'):
-        return 'Async Method'
-    elif 'get ' in method_line:
-        return 'Getter'
-    elif 'set ' in method_line:
-        return 'Setter'
-    else:
-        return 'Method'
+        pending = False
+    return flags
 
 def scan_all_files_for_jsdoc():
     """Scan all TypeScript and JavaScript files for missing JSDoc"""
     # Get the directory where this script is located
     script_dir = os.path.dirname(os.path.abspath(__file__))
     
-    # Search for both .ts and .js files recursively from script directory
-    ts_pattern = os.path.join(script_dir, "**", "*.ts")
-    js_pattern = os.path.join(script_dir, "**", "*.js")
-    
-    ts_files = glob.glob(ts_pattern, recursive=True)
-    js_files = glob.glob(js_pattern, recursive=True)
-    all_files = ts_files + js_files
-    
-    # Filter out node_modules and other unwanted directories
-    excluded_dirs = ['node_modules', '.git', 'dist', 'build', '.angular', 'coverage', '.vscode', '.idea']
-    files = []
-    for file_path in all_files:
-        # Check if file contains any excluded directory in its path
-        should_exclude = any(excluded_dir in file_path for excluded_dir in excluded_dirs)
-        if not should_exclude:
-            files.append(file_path)
-    
+    # Single pruning walk instead of two recursive globs plus a post-filter;
+    # excluded trees like node_modules are never even entered
+    files = list(_walk(script_dir))
+
     ts_files_filtered = [f for f in files if f.endswith('.ts')]
     js_files_filtered = [f for f in files if f.endswith('.js')]
     
-    # Prepare output content
-    output_lines = []
-    output_lines.append("JSDOC COVERAGE ANALYSIS REPORT")
-    output_lines.append(f"Generated: {os.popen('date /t').read().strip()} {os.popen('time /t').read().strip()}")
-    output_lines.append("=" * 80)
-    output_lines.append(f"Analyzing {len(files)} TypeScript/JavaScript files for missing JSDoc...")
-    output_lines.append(f"Search directory: {script_dir}")
-    output_lines.append(f"TypeScript files: {len(ts_files_filtered)}")
-    output_lines.append(f"JavaScript files: {len(js_files_filtered)}")
-    output_lines.append(f"Excluded directories: {', '.join(excluded_dirs)}")
-    output_lines.append("")
-    
-    print(f"Analyzing {len(files)} TypeScript/JavaScript files for missing JSDoc...")
-    print(f"Search directory: {script_dir}")
-    print(f"TypeScript files: {len(ts_files_filtered)}")
-    print(f"JavaScript files: {len(js_files_filtered)}")
-    print(f"Excluded directories: {', '.join(excluded_dirs)}")
-    print("")
-    
+    # Stream the report to the output file and the console as it is built;
+    # the old output_lines list kept a second full copy of the report in
+    # memory just to join it once at the end
+    output_file = "jsdoc_coverage_analysis.txt"
+    try:
+        report = open(output_file, 'w', encoding='utf-8')
+    except Exception as e:
+        print(f"Error opening {output_file}: {e}")
+        report = None
+
+    write = tee(*(s for s in (report, sys.stdout) if s is not None))
+
+    if report is not None:
+        report.write("JSDOC COVERAGE ANALYSIS REPORT\n")
+        report.write(f"Generated: {datetime.now():%Y-%m-%d %H:%M:%S}\n")
+        report.write("=" * 80 + "\n")
+
+    write(f"Analyzing {len(files)} TypeScript/JavaScript files for missing JSDoc...")
+    write(f"Search directory: {script_dir}")
+    write(f"TypeScript files: {len(ts_files_filtered)}")
+    write(f"JavaScript files: {len(js_files_filtered)}")
+    write(f"Excluded directories: {', '.join(sorted(_EXCLUDED_DIRS))}")
+    write("")
+
     all_missing_methods = []
     files_with_missing_jsdoc = 0
-    
-    for file_path in files:
-        missing_methods = analyze_jsdoc_coverage(file_path)
+
+    # Per-file analysis is CPU-bound and independent, so it runs across all
+    # cores; aggregation and printing stay serial on the main process
+    per_file_results = []
+    if files:
+        chunksize = max(1, len(files) // (4 * (os.cpu_count() or 1)))
+        with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                 mp_context=pool_context()) as executor:
+            per_file_results = list(zip(files, executor.map(analyze_jsdoc_coverage, files, chunksize=chunksize)))
+
+    for file_path, missing_methods in per_file_results:
         if missing_methods:
             files_with_missing_jsdoc += 1
             all_missing_methods.extend(missing_methods)
-            
-            file_output = f"File: {file_path}"
-            separator = "-" * 80
-            
-            print(file_output)
-            print(separator)
-            output_lines.append(file_output)
-            output_lines.append(separator)
-            
+
+            write(f"File: {file_path}")
+            write("-" * 80)
+
             for method in missing_methods:
-                method_info = f"  Method: {method['method_name']} (Line {method['start_line']})"
-                method_type = f"     Type: {method['method_type']}"
-                declaration = f"     Declaration: {method['declaration'][:70]}..."
-                
-                print(method_info)
-                print(method_type)
-                print(declaration)
-                print("")
-                
-                output_lines.append(method_info)
-                output_lines.append(method_type)
-                output_lines.append(declaration)
-                output_lines.append("")
+                write(f"  Method: {method.method_name} (Line {method.start_line})")
+                write(f"     Type: {method.method_type}")
+                write(f"     Declaration: {method.declaration[:70]}...")
+                write("")
     
     # Group by method type
     methods_by_type = {}
     for method in all_missing_methods:
-        method_type = method['method_type']
+        method_type = method.method_type
         if method_type not in methods_by_type:
             methods_by_type[method_type] = []
         methods_by_type[method_type].append(method)
     
     # Summary by method type
-    type_section = "=" * 80
-    type_header = "=== MISSING JSDOC BY METHOD TYPE ==="
-    
-    print(type_section)
-    print(type_header)
-    print(type_section)
-    
-    output_lines.append(type_section)
-    output_lines.append(type_header)
-    output_lines.append(type_section)
-    
+    write("=" * 80)
+    write("=== MISSING JSDOC BY METHOD TYPE ===")
+    write("=" * 80)
+
     for method_type, methods in sorted(methods_by_type.items()):
-        type_line = f"{method_type}: {len(methods)} methods missing JSDoc"
-        print(type_line)
-        output_lines.append(type_line)
-        
+        write(f"{method_type}: {len(methods)} methods missing JSDoc")
+
         # Show first few examples
         for i, method in enumerate(methods[:3]):
-            example = f"  - {method['method_name']} in {os.path.basename(method['file'])}"
-            print(example)
-            output_lines.append(example)
-        
+            write(f"  - {method.method_name} in {os.path.basename(method.file)}")
+
         if len(methods) > 3:
-            more = f"  ... and {len(methods) - 3} more"
-            print(more)
-            output_lines.append(more)
-        print("")
-        output_lines.append("")
+            write(f"  ... and {len(methods) - 3} more")
+        write("")
     
     # Top files with most missing JSDoc
     files_summary = {}
     for method in all_missing_methods:
-        file_path = method['file']
+        file_path = method.file
         if file_path not in files_summary:
             files_summary[file_path] = []
         files_summary[file_path].append(method)
     
     top_files = sorted(files_summary.items(), key=lambda x: len(x[1]), reverse=True)
-    
-    top_section = "=" * 80
-    top_header = "=== TOP 10 FILES WITH MOST MISSING JSDOC ==="
-    
-    print(top_section)
-    print(top_header)
-    print(top_section)
-    
-    output_lines.append(top_section)
-    output_lines.append(top_header)
-    output_lines.append(top_section)
-    
+
+    write("=" * 80)
+    write("=== TOP 10 FILES WITH MOST MISSING JSDOC ===")
+    write("=" * 80)
+
     for i, (file_path, methods) in enumerate(top_files[:10]):
-        rank_line = f"{i+1:2d}. {os.path.basename(file_path)} ({len(methods)} missing)"
-        file_line = f"    File: {file_path}"
-        
-        print(rank_line)
-        print(file_line)
-        
-        output_lines.append(rank_line)
-        output_lines.append(file_line)
-        
+        write(f"{i+1:2d}. {os.path.basename(file_path)} ({len(methods)} missing)")
+        write(f"    File: {file_path}")
+
         # Show method names
-        method_names = [m['method_name'] for m in methods[:5]]
+        method_names = [m.method_name for m in methods[:5]]
         methods_line = f"    Methods: {', '.join(method_names)}"
         if len(methods) > 5:
             methods_line += f" ... and {len(methods) - 5} more"
-        
-        print(methods_line)
-        print("")
-        
-        output_lines.append(methods_line)
-        output_lines.append("")
+
+        write(methods_line)
+        write("")
     
     # Overall summary
-    summary_header = "=== OVERALL SUMMARY ==="
-    files_analyzed = f"Files analyzed: {len(files)}"
-    files_missing = f"Files with missing JSDoc: {files_with_missing_jsdoc}"
-    total_missing = f"Total methods missing JSDoc: {len(all_missing_methods)}"
-    
-    print(summary_header)
-    print(files_analyzed)
-    print(files_missing)
-    print(total_missing)
-    
-    output_lines.append(summary_header)
-    output_lines.append(files_analyzed)
-    output_lines.append(files_missing)
-    output_lines.append(total_missing)
-    
+    write("=== OVERALL SUMMARY ===")
+    write(f"Files analyzed: {len(files)}")
+    write(f"Files with missing JSDoc: {files_with_missing_jsdoc}")
+    write(f"Total methods missing JSDoc: {len(all_missing_methods)}")
+
     if len(all_missing_methods) == 0:
-        perfect_msg = "Perfect! All methods have JSDoc documentation!"
-        print(perfect_msg)
-        output_lines.append(perfect_msg)
+        write("Perfect! All methods have JSDoc documentation!")
     else:
         coverage_percent = ((len(files) * 10 - len(all_missing_methods)) / (len(files) * 10)) * 100  # Rough estimate
-        coverage_msg = f"Estimated JSDoc coverage: {coverage_percent:.1f}%"
-        
-        print(coverage_msg)
-        output_lines.append(coverage_msg)
-        
+        write(f"Estimated JSDoc coverage: {coverage_percent:.1f}%")
+
         # Recommendations
         recommendations = [
             "\n=== RECOMMENDATIONS ===",
@@ -469,19 +311,13 @@ def scan_all_files_for_jsdoc():
             "• Document any thrown exceptions with @throws",
             "• Use @deprecated for methods planned for removal"
         ]
-        
+
         for rec in recommendations:
-            print(rec)
-            output_lines.append(rec)
-    
-    # Write to file
-    output_file = "jsdoc_coverage_analysis.txt"
-    try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(output_lines))
+            write(rec)
+
+    if report is not None:
+        report.close()
         print(f"\nResults saved to: {output_file}")
-    except Exception as e:
-        print(f"\nError saving to file: {e}")
 
 if __name__ == "__main__":
     scan_all_files_for_jsdoc()
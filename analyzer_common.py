@@ -0,0 +1,66 @@
+"""
+Shared helpers for the analyzer scripts
+Keeps single copies of code that used to be duplicated per script
+"""
+import os
+import sys
+
+# ANSI Color Codes for colored output
+class Colors:
+    RED = '\033[91m'
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    BLUE = '\033[94m'
+    MAGENTA = '\033[95m'
+    CYAN = '\033[96m'
+    WHITE = '\033[97m'
+    BOLD = '\033[1m'
+    RESET = '\033[0m'
+
+    # Precomposed styles: one escape sequence instead of concatenating
+    # BOLD + color on every call
+    BOLD_GREEN = '\033[1;92m'
+    BOLD_YELLOW = '\033[1;93m'
+    BOLD_MAGENTA = '\033[1;95m'
+    BOLD_CYAN = '\033[1;96m'
+    BOLD_WHITE = '\033[1;97m'
+
+    @staticmethod
+    def colorize(text: str, color: str) -> str:
+        """Colors text; blank text needs no escape codes at all"""
+        if not text or text.isspace():
+            return text
+        return f"{color}{text}{_RESET}"
+
+# colorize runs thousands of times per report; a module-level global is a
+# cheaper bytecode lookup than the class-attribute access on every call
+_RESET = Colors.RESET
+
+# When stdout is redirected (or NO_COLOR is set, or the terminal cannot
+# render escapes) ANSI sequences are just noise, so colorize collapses to
+# a zero-cost identity once at import
+if (not sys.stdout.isatty() or os.environ.get('NO_COLOR')
+        or os.environ.get('TERM') == 'dumb'):
+    Colors.colorize = staticmethod(lambda text, color: text)
+
+def pool_context():
+    """Multiprocessing context for the analyzer process pools. Where the
+    platform default is spawn (macOS, Windows since there is no fork), a
+    forkserver keeps one warm interpreter and forks workers from it,
+    skipping the per-worker startup and re-import cost; where fork is the
+    default it is already the fastest option, so None keeps it"""
+    import multiprocessing
+    if (multiprocessing.get_start_method() == 'spawn'
+            and 'forkserver' in multiprocessing.get_all_start_methods()):
+        return multiprocessing.get_context('forkserver')
+    return None
+
+def tee(*streams):
+    """Return a line writer that appends a newline and writes to every given
+    stream; report generation streams to the file and the console in one
+    call instead of a print plus a list append per line"""
+    def write(line=''):
+        text = f"{line}\n"
+        for stream in streams:
+            stream.write(text)
+    return write
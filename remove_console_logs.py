@@ -1,31 +1,195 @@
+import heapq
+import io
+import json
+import mmap
 import os
-import glob
 import re
-import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
 
-# ANSI Color Codes for colored output
-class Colors:
-    RED = '\033[91m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    MAGENTA = '\033[95m'
-    CYAN = '\033[96m'
-    WHITE = '\033[97m'
-    BOLD = '\033[1m'
-    RESET = '\033[0m'
-    
-    @staticmethod
-    def colorize(text: str, color: str) -> str:
-        """Colors text"""
-        return f"{color}{text}{Colors.RESET}"
+from analyzer_common import Colors, pool_context
+
+# Resolved once at import; the backup helpers used to recompute
+# dirname(abspath(__file__)) on every call
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Directory names excluded from scanning (including our own backups),
+# pruned before descending
+_EXCLUDED_DIRS = frozenset((
+    'node_modules', '.git', 'dist', 'build', '.angular',
+    'coverage', '.vscode', '.idea', 'backups'
+))
+
+def _walk(root):
+    """Yield .ts/.js paths below root, pruning excluded directories before
+    descending instead of globbing everything and filtering afterwards"""
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _EXCLUDED_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith(('.ts', '.js')):
+                    yield entry.path
+
+# Patterns compiled once at import; the per-file work then goes straight
+# to the compiled objects instead of re-probing re's cache per file.
+# Everything operates on bytes so the file contents never pass through
+# the UTF-8 codec in either direction.
+CONSOLE_LOG_COUNT_RE = re.compile(rb'console\.log\s*\(')
+# Three-plus blank lines collapse to two. [ \t\r] cannot match the \n
+# that ends each repetition, so the pattern matches in one linear pass;
+# the old nested \s* quantifiers could backtrack badly on long runs of
+# mixed whitespace
+EXCESS_BLANK_RE = re.compile(rb'\n(?:[ \t\r]*\n){3,}')
+
+# The call-end scanner spends nearly all its time skipping ordinary
+# bytes; these patterns hand that skipping to the regex engine so Python
+# code only runs on the few bytes that can change parser state
+_SYNTAX_RE = re.compile(rb'[()\'"`/]')
+_STRING_EVENT_RE = {
+    0x27: re.compile(rb"[\\'\n]"),
+    0x22: re.compile(rb'[\\"\n]'),
+    0x60: re.compile(rb'[\\`]'),
+}
+
+def _find_call_end(content, open_paren):
+    """Index just past the ')' matching the '(' at open_paren, or -1 if the
+    parentheses never balance. Parens inside string literals (', \", `),
+    behind escapes, or in // and /* */ comments are not counted, so
+    console.log(\"a ) b\") no longer confuses the scan the way the old
+    per-line count did"""
+    depth = 0
+    i = open_paren
+    size = len(content)
+    search = _SYNTAX_RE.search
+    while i < size:
+        found = search(content, i)
+        if found is None:
+            return -1
+        i = found.start()
+        c = content[i]
+        if c == 0x28:    # (
+            depth += 1
+        elif c == 0x29:  # )
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        elif c == 0x2F:  # /
+            after = content[i + 1:i + 2]
+            if after == b'/':
+                i = content.find(b'\n', i + 2)
+                if i == -1:
+                    return -1
+            elif after == b'*':
+                i = content.find(b'*/', i + 2)
+                if i == -1:
+                    return -1
+                i += 1
+        else:            # ' " ` : skip to the end of the string literal
+            event = _STRING_EVENT_RE[c].search
+            j = i + 1
+            while True:
+                found = event(content, j)
+                if found is None:
+                    # Unterminated literal running to end of file
+                    return -1
+                i = found.start()
+                if content[i] == 0x5C:  # backslash: skip the escaped byte
+                    j = i + 2
+                    continue
+                # Closing quote, or the newline ending an unterminated
+                # plain string (only templates may span lines)
+                break
+        i += 1
+    return -1
+
+def _strip(content):
+    """Removes console.log statements in one left-to-right pass: whole
+    lines when the call starts its line (single or multiline), the call
+    plus the trailing dot when it is chained inside an expression, and
+    nothing otherwise. Replaces the old pipeline of separate single-line,
+    multiline and chained passes that each rewrote the entire buffer.
+    Returns (new_content, statements_removed)"""
+    parts = []
+    cursor = 0
+    removed = 0
+    size = len(content)
+    for match in CONSOLE_LOG_COUNT_RE.finditer(content):
+        call_start = match.start()
+        if call_start < cursor:
+            # Inside a span that was already consumed
+            continue
+        end = _find_call_end(content, match.end() - 1)
+        if end == -1:
+            # Unbalanced to end of file; leave it for manual review
+            continue
+
+        line_start = content.rfind(b'\n', 0, call_start) + 1
+        if not content[line_start:call_start].strip():
+            # The statement starts its own line
+            tail = end
+            if content[tail:tail + 1] == b';':
+                tail += 1
+            newline = content.find(b'\n', tail)
+            if newline == -1:
+                newline = size
+            parts.append(content[cursor:line_start])
+            if b'\n' not in content[call_start:end] and not content[tail:newline].strip():
+                # Simple single-line statement: drop the text but keep the
+                # blank line; runs of those collapse in the cleanup pass
+                cursor = newline
+            else:
+                # Multiline statement (or trailing junk): drop the lines
+                cursor = min(newline + 1, size)
+            removed += 1
+        elif content[end:end + 1] == b'.':
+            # Chained inside an expression: drop the call and the dot
+            parts.append(content[cursor:call_start])
+            cursor = end + 1
+            removed += 1
+        # Any other inline console.log stays and is reported as remaining
+
+    if not removed:
+        return content, 0
+    parts.append(content[cursor:])
+    return b''.join(parts), removed
+
+# Cache of files known to contain no console.log, keyed by path relative
+# to the script directory with the (st_mtime_ns, st_size) pair seen at
+# the time; on later runs matching files are skipped without being read
+_CACHE_FILE = '.console_log_cache.json'
+
+def _load_cache(script_dir):
+    """The previous run's clean-file cache, or an empty dict"""
+    try:
+        with open(os.path.join(script_dir, _CACHE_FILE), 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def _save_cache(script_dir, cache):
+    """Persists the clean-file cache; an unwritable cache just means the
+    next run rescans everything"""
+    try:
+        with open(os.path.join(script_dir, _CACHE_FILE), 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
 
 def create_backup_folder():
     """Creates a backup folder with timestamp"""
-    script_dir = os.path.dirname(os.path.abspath(__file__))
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_dir = os.path.join(script_dir, "backups", f"console_log_backup_{timestamp}")
+    backup_dir = os.path.join(_SCRIPT_DIR, "backups", f"console_log_backup_{timestamp}")
     
     try:
         os.makedirs(backup_dir, exist_ok=True)
@@ -34,13 +198,34 @@ def create_backup_folder():
         print(Colors.colorize(f"❌ ERROR: Could not create backup folder: {e}", Colors.RED))
         return None
 
+def _clone_or_copy(src: str, dst: str) -> None:
+    """Copies src to dst, as a reflink where the filesystem supports it
+    (Btrfs, XFS): the clone shares extents with the original, so the
+    backup costs one ioctl instead of a full userspace copy. Falls back
+    to a regular metadata-preserving copy everywhere else"""
+    # Deferred: only backup runs need shutil, so declining the backup
+    # prompt never loads it
+    import shutil
+    if sys.platform == 'linux':
+        import fcntl
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), 0x40049409, fsrc.fileno())  # FICLONE
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            # Filesystem without reflink support, or a cross-device clone
+            try:
+                os.unlink(dst)
+            except OSError:
+                pass
+    shutil.copy2(src, dst)
+
 def backup_file(file_path: str, backup_dir: str) -> bool:
     """Creates a backup of a file maintaining directory structure"""
     try:
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        
         # Get relative path from script directory
-        rel_path = os.path.relpath(file_path, script_dir)
+        rel_path = os.path.relpath(file_path, _SCRIPT_DIR)
         
         # Create backup file path
         backup_file_path = os.path.join(backup_dir, rel_path)
@@ -50,7 +235,7 @@ def backup_file(file_path: str, backup_dir: str) -> bool:
         os.makedirs(backup_file_dir, exist_ok=True)
         
         # Copy the file
-        shutil.copy2(file_path, backup_file_path)
+        _clone_or_copy(file_path, backup_file_path)
         
         return True
     except Exception as e:
@@ -59,14 +244,14 @@ def backup_file(file_path: str, backup_dir: str) -> bool:
 
 def ask_for_backup() -> bool:
     """Asks user if they want to create backups"""
-    print(Colors.colorize("🔒 BACKUP OPTION", Colors.BOLD + Colors.CYAN))
+    print(Colors.colorize("🔒 BACKUP OPTION", Colors.BOLD_CYAN))
     print(Colors.colorize("The Console.log Remover will modify your files.", Colors.YELLOW))
     print(Colors.colorize("It's recommended to create backups before proceeding.", Colors.YELLOW))
     print()
     
     while True:
         try:
-            response = input(Colors.colorize("Create backups before removing console.logs? (y/n): ", Colors.BOLD + Colors.CYAN)).strip().lower()
+            response = input(Colors.colorize("Create backups before removing console.logs? (y/n): ", Colors.BOLD_CYAN)).strip().lower()
             
             if response in ['y', 'yes', 'j', 'ja']:
                 return True
@@ -84,14 +269,26 @@ def remove_console_logs_from_file(file_path, backup_dir=None):
     Handles various console.log patterns while preserving code structure
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        original_content = content
-        
-        # Count original console.log occurrences for reporting
-        original_count = len(re.findall(r'console\.log\s*\(', content))
-        
+        # The file is probed through a read-only mapping, so clean files
+        # are rejected straight off the page cache without ever
+        # materializing a bytes copy; only files that need scanning get one
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                original_count = 0
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # Most files contain no console.log at all; a C-speed
+                    # substring probe rules them out before any regex runs.
+                    # The counting pattern requires the literal
+                    # 'console.log', so the full needle is safe and rejects
+                    # files that merely mention console
+                    if mm.find(b'console.log') == -1:
+                        original_count = 0
+                    else:
+                        content = bytes(mm)
+                        # Count original console.log occurrences for reporting
+                        original_count = len(CONSOLE_LOG_COUNT_RE.findall(content))
+
         if original_count == 0:
             return {
                 'file': file_path,
@@ -103,87 +300,39 @@ def remove_console_logs_from_file(file_path, backup_dir=None):
             }
         
         # Create backup if backup directory is provided
+        # The worker only records the backup; the caller prints it so the
+        # pool processes never contend for stdout
         backed_up = False
         if backup_dir:
             backed_up = backup_file(file_path, backup_dir)
-            if backed_up:
-                print(Colors.colorize(f"📋 Backed up: {os.path.basename(file_path)}", Colors.GREEN))
-        
-        # Pattern 1: Simple single-line console.log statements
-        # Matches: console.log('message'); or console.log(variable);
-        content = re.sub(r'^\s*console\.log\s*\([^)]*\);\s*$', '', content, flags=re.MULTILINE)
-        
-        # Pattern 2: Console.log without semicolon at end of line
-        content = re.sub(r'^\s*console\.log\s*\([^)]*\)\s*$', '', content, flags=re.MULTILINE)
-        
-        # Pattern 3: Console.log with complex parameters (template literals, function calls, etc.)
-        # This handles multiline console.log with balanced parentheses
-        def remove_multiline_console_logs(text):
-            lines = text.split('\n')
-            result_lines = []
-            i = 0
-            
-            while i < len(lines):
-                line = lines[i]
-                stripped = line.strip()
-                
-                # Check if line starts with console.log
-                if re.match(r'^\s*console\.log\s*\(', line):
-                    # Count parentheses to find the complete statement
-                    paren_count = 0
-                    log_lines = []
-                    j = i
-                    
-                    while j < len(lines):
-                        current_line = lines[j]
-                        log_lines.append(current_line)
-                        
-                        # Count parentheses in this line
-                        for char in current_line:
-                            if char == '(':
-                                paren_count += 1
-                            elif char == ')':
-                                paren_count -= 1
-                        
-                        # If parentheses are balanced and we found at least one opening paren
-                        if paren_count == 0 and len(log_lines) > 0:
-                            # Skip all these lines (they form the complete console.log)
-                            i = j + 1
-                            break
-                        
-                        j += 1
-                    
-                    # If we couldn't balance parentheses, treat as single line
-                    if paren_count != 0:
-                        result_lines.append(line)
-                        i += 1
-                else:
-                    result_lines.append(line)
-                    i += 1
-            
-            return '\n'.join(result_lines)
-        
-        content = remove_multiline_console_logs(content)
-        
-        # Pattern 4: Inline console.log in expressions (more complex)
-        # Handle: someFunction(console.log('debug'), otherParam)
-        # This is trickier and might need manual review
-        
-        # Pattern 5: Console.log with chained methods
-        # Remove: console.log().someMethod() -> .someMethod()
-        content = re.sub(r'console\.log\s*\([^)]*\)\.', '', content)
-        
+
+        # Every pattern replaces a non-empty match with something shorter,
+        # so any substitution means the content really changed; counting
+        # them lets the unchanged case skip the full-buffer comparison
+        # and the write entirely
+        total_subs = 0
+
+        # All statement forms (single-line, multiline, chained) come out in
+        # one scan over the buffer; inline console.log in expressions like
+        # someFunction(console.log('debug'), otherParam) is left for manual
+        # review and shows up in the remaining count
+        content, n = _strip(content)
+        total_subs += n
+
         # Clean up excessive empty lines (more than 2 consecutive empty lines)
-        content = re.sub(r'\n\s*\n\s*\n\s*\n+', '\n\n\n', content)
-        
+        content, n = EXCESS_BLANK_RE.subn(b'\n\n\n', content)
+        total_subs += n
+
         # Count remaining console.log occurrences
-        remaining_count = len(re.findall(r'console\.log\s*\(', content))
+        remaining_count = len(CONSOLE_LOG_COUNT_RE.findall(content))
         removed_count = original_count - remaining_count
         
-        # Only write back if content changed
-        modified = content != original_content
+        # Only write back if a substitution actually happened; every match
+        # shrinks the text, so the counter replaces the O(n) comparison of
+        # the two buffers
+        modified = total_subs > 0
         if modified:
-            with open(file_path, 'w', encoding='utf-8') as f:
+            with open(file_path, 'wb') as f:
                 f.write(content)
         
         return {
@@ -225,63 +374,51 @@ def scan_and_remove_console_logs():
             create_backup = False
     
     # Get the directory where this script is located
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    
-    # Define file patterns to search for
-    file_patterns = [
-        "**/*.js",
-        "**/*.ts"
-    ]
-    
-    # Collect all files
-    all_files = []
-    for pattern in file_patterns:
-        full_pattern = os.path.join(script_dir, pattern)
-        files = glob.glob(full_pattern, recursive=True)
-        all_files.extend(files)
-    
-    # Filter out unwanted directories (including backup folders)
-    excluded_dirs = ['node_modules', '.git', 'dist', 'build', '.angular', 'coverage', '.vscode', '.idea', 'backups']
-    files = []
-    for file_path in all_files:
-        # Check if file contains any excluded directory in its path
-        should_exclude = any(excluded_dir in file_path for excluded_dir in excluded_dirs)
-        if not should_exclude:
-            files.append(file_path)
-    
-    print()
-    print(Colors.colorize("🧹 CONSOLE.LOG REMOVAL ANALYSIS", Colors.BOLD + Colors.CYAN))
-    print(Colors.colorize("=" * 50, Colors.CYAN))
-    print(Colors.colorize(f"📁 Search directory: {script_dir}", Colors.BLUE))
-    print(Colors.colorize(f"📄 JavaScript files: {len([f for f in files if f.endswith('.js')])}", Colors.GREEN))
-    print(Colors.colorize(f"📘 TypeScript files: {len([f for f in files if f.endswith('.ts')])}", Colors.GREEN))
-    print(Colors.colorize(f"🔒 Backup enabled: {'Yes' if create_backup else 'No'}", Colors.YELLOW if create_backup else Colors.RED))
-    print()
+    script_dir = _SCRIPT_DIR
+
+    # Single pruning walk instead of two recursive globs plus a substring
+    # filter; excluded trees like node_modules are never even entered
+    files = list(_walk(script_dir))
     
-    # Prepare output content
-    output_lines = []
-    output_lines.append("CONSOLE.LOG REMOVAL REPORT")
-    output_lines.append(f"Generated: {os.popen('date /t').read().strip()} {os.popen('time /t').read().strip()}")
-    output_lines.append("=" * 80)
-    output_lines.append(f"Analyzing {len(files)} JavaScript/TypeScript files for console.log removal...")
-    output_lines.append(f"Search directory: {script_dir}")
+    # All console output is collected here and written in one go at the
+    # end; emit() is console-only, report() mirrors the line into the
+    # report body as the old print+append pairs did. No input happens
+    # after this point, so deferring the output is safe.
+    console = []
+    emit = console.append
+
+    def report(line=''):
+        console.append(line)
+        out.write(line)
+        out.write('\n')
+
+    emit('')
+    emit(Colors.colorize("🧹 CONSOLE.LOG REMOVAL ANALYSIS", Colors.BOLD_CYAN))
+    emit(Colors.colorize("=" * 50, Colors.CYAN))
+    emit(Colors.colorize(f"📁 Search directory: {script_dir}", Colors.BLUE))
+    emit(Colors.colorize(f"📄 JavaScript files: {len([f for f in files if f.endswith('.js')])}", Colors.GREEN))
+    emit(Colors.colorize(f"📘 TypeScript files: {len([f for f in files if f.endswith('.ts')])}", Colors.GREEN))
+    emit(Colors.colorize(f"🔒 Backup enabled: {'Yes' if create_backup else 'No'}", Colors.YELLOW if create_backup else Colors.RED))
+    emit('')
+
+    # Prepare output content; a StringIO grows its buffer in place instead
+    # of holding one string object per line plus a final join pass
+    out = io.StringIO()
+    out.write("CONSOLE.LOG REMOVAL REPORT\n")
+    out.write(f"Generated: {datetime.now():%Y-%m-%d %H:%M:%S}\n")
+    out.write("=" * 80 + "\n")
+    out.write(f"Analyzing {len(files)} JavaScript/TypeScript files for console.log removal...\n")
+    out.write(f"Search directory: {script_dir}\n")
     
     # Display file counts by type
     js_files = [f for f in files if f.endswith('.js')]
     ts_files = [f for f in files if f.endswith('.ts')]
     
-    js_count_msg = f"JavaScript files: {len(js_files)}"
-    ts_count_msg = f"TypeScript files: {len(ts_files)}"
-    
-    print(js_count_msg)
-    print(ts_count_msg)
-    output_lines.append(js_count_msg)
-    output_lines.append(ts_count_msg)
-    
-    output_lines.append(f"Excluded directories: {', '.join(excluded_dirs)}")
-    output_lines.append("")
-    print(f"Excluded directories: {', '.join(excluded_dirs)}")
-    print("")
+    report(f"JavaScript files: {len(js_files)}")
+    report(f"TypeScript files: {len(ts_files)}")
+
+    report(f"Excluded directories: {', '.join(sorted(_EXCLUDED_DIRS))}")
+    report("")
     
     # Process each file
     total_original_logs = 0
@@ -292,19 +429,58 @@ def scan_and_remove_console_logs():
     files_backed_up = 0
     files_with_logs = []
     
+    # Files recorded as clean on a previous run are skipped without being
+    # read, as long as mtime and size still match; anything that ever had
+    # a console.log is always reprocessed
+    cache = _load_cache(script_dir)
+    signatures = {}
+    pending = []
+    result_by_path = {}
+    for path in files:
+        try:
+            st = os.stat(path)
+        except OSError:
+            pending.append(path)
+            continue
+        sig = [st.st_mtime_ns, st.st_size]
+        signatures[path] = sig
+        if cache.get(os.path.relpath(path, script_dir)) == sig:
+            result_by_path[path] = {
+                'file': path,
+                'original_logs': 0,
+                'removed_logs': 0,
+                'modified': False,
+                'backed_up': False,
+                'error': None
+            }
+        else:
+            pending.append(path)
+
+    # Each file is independent scan-and-rewrite work (including its backup
+    # copy), so it runs across all cores like the analyzer scans; reporting
+    # below stays serial and in the original file order
+    if pending:
+        chunksize = max(1, len(pending) // (4 * (os.cpu_count() or 1)))
+        with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                 mp_context=pool_context()) as executor:
+            result_by_path.update(zip(pending, executor.map(
+                partial(remove_console_logs_from_file, backup_dir=backup_dir),
+                pending, chunksize=chunksize)))
+
     for file_path in files:
+        result = result_by_path[file_path]
         file_name = os.path.basename(file_path)
-        print(Colors.colorize(f"🔍 Processing: {file_name}", Colors.CYAN))
-        result = remove_console_logs_from_file(file_path, backup_dir)
-        
+        emit(Colors.colorize(f"🔍 Processing: {file_name}", Colors.CYAN))
+
         if result['error']:
             files_with_errors += 1
-            print(Colors.colorize(f"❌ ERROR processing {file_name}: {result['error']}", Colors.RED))
+            emit(Colors.colorize(f"❌ ERROR processing {file_name}: {result['error']}", Colors.RED))
             continue
         
         if result['backed_up']:
             files_backed_up += 1
-        
+            emit(Colors.colorize(f"📋 Backed up: {file_name}", Colors.GREEN))
+
         if result['original_logs'] > 0:
             files_with_logs.append(result)
             total_original_logs += result['original_logs']
@@ -313,133 +489,128 @@ def scan_and_remove_console_logs():
             
             if result['modified']:
                 files_modified += 1
-                print(Colors.colorize(f"  🧹 Removed {result['removed_logs']} console.logs", Colors.GREEN))
+                emit(Colors.colorize(f"  🧹 Removed {result['removed_logs']} console.logs", Colors.GREEN))
                 if result['remaining_logs'] > 0:
-                    print(Colors.colorize(f"  ⚠️ {result['remaining_logs']} console.logs remaining", Colors.YELLOW))
+                    emit(Colors.colorize(f"  ⚠️ {result['remaining_logs']} console.logs remaining", Colors.YELLOW))
             else:
-                print(Colors.colorize(f"  ℹ️ {result['original_logs']} console.logs found but couldn't be removed", Colors.BLUE))
-        
-        if result['original_logs'] > 0:
-            files_with_logs.append(result)
+                emit(Colors.colorize(f"  ℹ️ {result['original_logs']} console.logs found but couldn't be removed", Colors.BLUE))
         else:
-            print(Colors.colorize(f"  ✅ No console.logs found", Colors.GREEN))
+            emit(Colors.colorize(f"  ✅ No console.logs found", Colors.GREEN))
     
-    # Sort files by number of original console.logs (most first)
-    files_with_logs.sort(key=lambda x: x['original_logs'], reverse=True)
-    
-    # Top 10 files with most console.logs
+    # Rebuild the cache from this run: every clean file keeps (or gains)
+    # an entry; vanished files and files with console.logs drop out
+    new_cache = {}
+    for path in files:
+        sig = signatures.get(path)
+        result = result_by_path.get(path)
+        if (sig is not None and result is not None
+                and result['error'] is None and result['original_logs'] == 0):
+            new_cache[os.path.relpath(path, script_dir)] = sig
+    _save_cache(script_dir, new_cache)
+
+    # Top 10 files with most console.logs; a bounded heap selection
+    # instead of sorting the whole list just to slice ten entries
     if files_with_logs:
         top_section = "=" * 80
         top_header = "=== TOP 10 FILES WITH MOST CONSOLE.LOGS (ORIGINAL) ==="
-        
-        print(top_section)
-        print(top_header)
-        print(top_section)
-        
-        output_lines.append(top_section)
-        output_lines.append(top_header)
-        output_lines.append(top_section)
-        
-        for i, result in enumerate(files_with_logs[:10]):
-            rank_line = f"{i+1:2d}. {os.path.basename(result['file'])} ({result['original_logs']} original, {result['removed_logs']} removed, {result['remaining_logs']} remaining)"
-            file_line = f"    File: {result['file']}"
-            
-            print(rank_line)
-            print(file_line)
-            print("")
-            
-            output_lines.append(rank_line)
-            output_lines.append(file_line)
-            output_lines.append("")
+
+        report(top_section)
+        report(top_header)
+        report(top_section)
+
+        top_files = heapq.nlargest(10, files_with_logs, key=lambda x: x['original_logs'])
+        for i, result in enumerate(top_files):
+            report(f"{i+1:2d}. {os.path.basename(result['file'])} ({result['original_logs']} original, {result['removed_logs']} removed, {result['remaining_logs']} remaining)")
+            report(f"    File: {result['file']}")
+            report("")
     
     # Files with remaining console.logs (need manual review)
     files_with_remaining = [f for f in files_with_logs if f['remaining_logs'] > 0]
     if files_with_remaining:
-        remaining_header = "=== FILES WITH REMAINING CONSOLE.LOGS (NEED MANUAL REVIEW) ==="
-        print(remaining_header)
-        output_lines.append(remaining_header)
-        
+        report("=== FILES WITH REMAINING CONSOLE.LOGS (NEED MANUAL REVIEW) ===")
+
         for result in files_with_remaining:
-            remaining_line = f"• {os.path.basename(result['file'])}: {result['remaining_logs']} remaining console.logs"
-            print(remaining_line)
-            output_lines.append(remaining_line)
-        
-        output_lines.append("")
-        print("")
+            report(f"• {os.path.basename(result['file'])}: {result['remaining_logs']} remaining console.logs")
+
+        report("")
     
     # Overall summary
-    print(Colors.colorize("\n" + "=" * 60, Colors.YELLOW))
-    print(Colors.colorize("CONSOLE.LOG REMOVAL SUMMARY", Colors.YELLOW))
-    print(Colors.colorize("=" * 60, Colors.YELLOW))
-    
-    print(Colors.colorize(f"📁 Files analyzed: {len(files)}", Colors.CYAN))
-    print(Colors.colorize(f"🎯 Files with console.logs: {len(files_with_logs)}", Colors.CYAN))
-    print(Colors.colorize(f"✏️ Files modified: {files_modified}", Colors.GREEN if files_modified > 0 else Colors.BLUE))
-    print(Colors.colorize(f"💾 Files backed up: {files_backed_up}", Colors.GREEN if files_backed_up > 0 else Colors.BLUE))
-    print(Colors.colorize(f"❌ Files with errors: {files_with_errors}", Colors.RED if files_with_errors > 0 else Colors.GREEN))
-    print(Colors.colorize(f"📊 Total console.logs found: {total_original_logs}", Colors.BLUE))
-    print(Colors.colorize(f"🧹 Total console.logs removed: {total_removed_logs}", Colors.GREEN))
-    print(Colors.colorize(f"⚠️ Total console.logs remaining: {total_remaining_logs}", Colors.YELLOW if total_remaining_logs > 0 else Colors.GREEN))
-    
+    emit(Colors.colorize("\n" + "=" * 60, Colors.YELLOW))
+    emit(Colors.colorize("CONSOLE.LOG REMOVAL SUMMARY", Colors.YELLOW))
+    emit(Colors.colorize("=" * 60, Colors.YELLOW))
+
+    emit(Colors.colorize(f"📁 Files analyzed: {len(files)}", Colors.CYAN))
+    emit(Colors.colorize(f"⏭️ Files skipped (unchanged since last run): {len(files) - len(pending)}", Colors.CYAN))
+    emit(Colors.colorize(f"🎯 Files with console.logs: {len(files_with_logs)}", Colors.CYAN))
+    emit(Colors.colorize(f"✏️ Files modified: {files_modified}", Colors.GREEN if files_modified > 0 else Colors.BLUE))
+    emit(Colors.colorize(f"💾 Files backed up: {files_backed_up}", Colors.GREEN if files_backed_up > 0 else Colors.BLUE))
+    emit(Colors.colorize(f"❌ Files with errors: {files_with_errors}", Colors.RED if files_with_errors > 0 else Colors.GREEN))
+    emit(Colors.colorize(f"📊 Total console.logs found: {total_original_logs}", Colors.BLUE))
+    emit(Colors.colorize(f"🧹 Total console.logs removed: {total_removed_logs}", Colors.GREEN))
+    emit(Colors.colorize(f"⚠️ Total console.logs remaining: {total_remaining_logs}", Colors.YELLOW if total_remaining_logs > 0 else Colors.GREEN))
+
     if backup_dir and files_backed_up > 0:
-        print(Colors.colorize(f"💾 Backup location: {backup_dir}", Colors.CYAN))
-    
+        emit(Colors.colorize(f"💾 Backup location: {backup_dir}", Colors.CYAN))
+
     if total_removed_logs == 0:
-        print(Colors.colorize("ℹ️ No console.log statements found to remove!", Colors.BLUE))
+        emit(Colors.colorize("ℹ️ No console.log statements found to remove!", Colors.BLUE))
     else:
         success_rate = (total_removed_logs / total_original_logs) * 100 if total_original_logs > 0 else 0
-        print(Colors.colorize(f"📈 Removal success rate: {success_rate:.1f}%", Colors.GREEN))
-        
+        emit(Colors.colorize(f"📈 Removal success rate: {success_rate:.1f}%", Colors.GREEN))
+
     if total_remaining_logs > 0:
         files_with_remaining = [f for f in files_with_logs if f['remaining_logs'] > 0]
-        print(Colors.colorize(f"⚠️ Manual review needed for {len(files_with_remaining)} files with {total_remaining_logs} remaining console.logs", Colors.YELLOW))
+        emit(Colors.colorize(f"⚠️ Manual review needed for {len(files_with_remaining)} files with {total_remaining_logs} remaining console.logs", Colors.YELLOW))
     
     # Write summary to file
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_file = f"console_log_removal_report_{timestamp}.txt"
     
-    output_lines = [
-        "CONSOLE.LOG REMOVAL REPORT",
-        "=" * 60,
-        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        "",
-        f"Files analyzed: {len(files)}",
-        f"Files with console.logs: {len(files_with_logs)}",
-        f"Files modified: {files_modified}",
-        f"Files backed up: {files_backed_up}",
-        f"Files with errors: {files_with_errors}",
-        f"Total console.logs found: {total_original_logs}",
-        f"Total console.logs removed: {total_removed_logs}",
-        f"Total console.logs remaining: {total_remaining_logs}",
-        ""
-    ]
-    
+    # The saved file carries only the summary, so the buffer restarts here
+    # (matching the old list reassignment)
+    out = io.StringIO()
+    out.write("CONSOLE.LOG REMOVAL REPORT\n")
+    out.write("=" * 60 + "\n")
+    out.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    out.write("\n")
+    out.write(f"Files analyzed: {len(files)}\n")
+    out.write(f"Files with console.logs: {len(files_with_logs)}\n")
+    out.write(f"Files modified: {files_modified}\n")
+    out.write(f"Files backed up: {files_backed_up}\n")
+    out.write(f"Files with errors: {files_with_errors}\n")
+    out.write(f"Total console.logs found: {total_original_logs}\n")
+    out.write(f"Total console.logs removed: {total_removed_logs}\n")
+    out.write(f"Total console.logs remaining: {total_remaining_logs}\n")
+    out.write("\n")
+
     if backup_dir and files_backed_up > 0:
-        output_lines.append(f"Backup location: {backup_dir}")
-        output_lines.append("")
-    
+        out.write(f"Backup location: {backup_dir}\n\n")
+
     if total_removed_logs > 0:
         success_rate = (total_removed_logs / total_original_logs) * 100
-        output_lines.append(f"Removal success rate: {success_rate:.1f}%")
-        output_lines.append("")
-    
+        out.write(f"Removal success rate: {success_rate:.1f}%\n\n")
+
     # Add detailed file information
     if files_with_logs:
-        output_lines.append("DETAILED FILE RESULTS:")
-        output_lines.append("-" * 40)
+        out.write("DETAILED FILE RESULTS:\n")
+        out.write("-" * 40 + "\n")
         for result in sorted(files_with_logs, key=lambda x: x['original_logs'], reverse=True):
-            output_lines.append(f"File: {result['file']}")
-            output_lines.append(f"  Original: {result['original_logs']}, Removed: {result['removed_logs']}, Remaining: {result['remaining_logs']}")
-            output_lines.append(f"  Status: {'Modified' if result['modified'] else 'No changes needed'}")
+            out.write(f"File: {result['file']}\n")
+            out.write(f"  Original: {result['original_logs']}, Removed: {result['removed_logs']}, Remaining: {result['remaining_logs']}\n")
+            out.write(f"  Status: {'Modified' if result['modified'] else 'No changes needed'}\n")
             if result['backed_up']:
-                output_lines.append(f"  Backup: Created")
-            output_lines.append("")
+                out.write("  Backup: Created\n")
+            out.write("\n")
     try:
         with open(output_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(output_lines))
-        print(Colors.colorize(f"\n💾 Report saved to: {output_file}", Colors.CYAN))
+            f.write(out.getvalue())
+        emit(Colors.colorize(f"\n💾 Report saved to: {output_file}", Colors.CYAN))
     except Exception as e:
-        print(Colors.colorize(f"\n❌ Error saving report: {e}", Colors.RED))
+        emit(Colors.colorize(f"\n❌ Error saving report: {e}", Colors.RED))
+
+    # One write for the whole session's console output
+    sys.stdout.write('\n'.join(console) + '\n')
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     print(Colors.colorize("🚀 Console.log Removal Tool", Colors.CYAN))